@@ -5,6 +5,7 @@ This version correctly maintains position state so you can move continuously
 
 from direct.showbase.ShowBase import ShowBase
 from panda3d.core import WindowProperties, Point3
+from direct.showbase.ShowBase import globalClock
 from direct.task import Task
 
 class SimpleMovement(ShowBase):
@@ -144,9 +145,9 @@ class SimpleMovement(ShowBase):
     def movement_update_task(self, task):
         """Update movement every frame - with proper state management"""
         
-        # Use a fixed delta time for consistent movement
-        # In a real game, you'd calculate actual frame time
-        dt = 0.016  # Assuming 60 FPS
+        # Use the actual frame time so speed stays in units/second
+        # even when the frame rate drops below 60 FPS
+        dt = globalClock.getDt()
         
         # Calculate movement based on pressed keys
         movement_vector = Point3(0, 0, 0)
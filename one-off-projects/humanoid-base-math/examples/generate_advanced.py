@@ -17,19 +17,25 @@ Shows the progression from 450-vert geometric to ~2k-vert semi-realistic.
 
 import sys
 import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.params import HumanoidParams, get_preset
-from src.mesh import generate_base_mesh
-from src.advanced_math import (
-    AdvancedMathematicalModel,
-    enhance_mesh_with_advanced_math
-)
+from src.mesh import generate_base_mesh, write_obj_fast
 import numpy as np
 
+# trimesh debug logging only adds per-mesh overhead in these batch scripts
+logging.getLogger('trimesh').setLevel(logging.WARNING)
+
 
 def demonstrate_progression():
     """Show progression from geometric to advanced mathematical."""
+    from src.advanced_math import (
+        AdvancedMathematicalModel,
+        build_vertex_face_incidence,
+        compute_vertex_normals
+    )
     
     print("=" * 80)
     print("MATHEMATICAL HUMANOID PROGRESSION DEMONSTRATION")
@@ -40,6 +46,10 @@ def demonstrate_progression():
     output_dir = os.path.join(os.path.dirname(__file__), '..', 'outputs', 'advanced')
     os.makedirs(output_dir, exist_ok=True)
     
+    # Overlap OBJ writes with the next level's math
+    io_pool = ThreadPoolExecutor(max_workers=2)
+    exports = []
+    
     # Initialize advanced math model
     adv_model = AdvancedMathematicalModel()
     
@@ -56,7 +66,7 @@ def demonstrate_progression():
     basic_mesh = generate_base_mesh(params, apply_smoothing=True)
     
     basic_path = os.path.join(output_dir, 'level1_basic_geometric.obj')
-    basic_mesh.export(basic_path)
+    exports.append(io_pool.submit(write_obj_fast, basic_path, basic_mesh.vertices, basic_mesh.faces))
     
     print(f"Generated: {len(basic_mesh.vertices)} vertices")
     print(f"Quality: Intentionally geometric (Minecraft/Roblox style)")
@@ -92,20 +102,15 @@ def demonstrate_progression():
         0.3    # Limb thickness
     ])
     
-    blended_verts = adv_model.apply_blend_shapes(
-        basic_mesh.vertices,
-        blend_shapes,
-        blend_weights
+    # V_final = V_base + Σ(B_i * w_i) as a single contraction over shapes
+    blended_verts = basic_mesh.vertices + np.einsum(
+        's,svc->vc', blend_weights, blend_shapes, optimize=True
     )
     
-    # Create new mesh with blended vertices
-    import trimesh
-    blend_mesh = trimesh.Trimesh(vertices=blended_verts, faces=basic_mesh.faces)
-    
     blend_path = os.path.join(output_dir, 'level2_smpl_blendshapes.obj')
-    blend_mesh.export(blend_path)
+    exports.append(io_pool.submit(write_obj_fast, blend_path, blended_verts, basic_mesh.faces))
     
-    print(f"Generated: {len(blend_mesh.vertices)} vertices")
+    print(f"Generated: {len(blended_verts)} vertices")
     print(f"Quality: Smooth geometric with anatomical proportions")
     print(f"Improvement: Better body shape variation, still clean topology")
     print(f"Exported: {blend_path}")
@@ -120,8 +125,10 @@ def demonstrate_progression():
     print("Total effective rules: ~100,000")
     print("-" * 80)
     
-    # Calculate normals for noise displacement
-    normals = blend_mesh.vertex_normals
+    # Calculate normals for noise displacement. Topology is shared by every
+    # level, so the face->vertex scatter is built once and reused.
+    incidence = build_vertex_face_incidence(basic_mesh.faces, len(basic_mesh.vertices))
+    normals = compute_vertex_normals(blended_verts, basic_mesh.faces, incidence)
     
     # Add organic detail
     detailed_verts = adv_model.add_organic_detail(
@@ -139,12 +146,10 @@ def demonstrate_progression():
         strength=0.002
     )
     
-    detailed_mesh = trimesh.Trimesh(vertices=detailed_verts, faces=basic_mesh.faces)
-    
     detail_path = os.path.join(output_dir, 'level3_fractal_detail.obj')
-    detailed_mesh.export(detail_path)
+    exports.append(io_pool.submit(write_obj_fast, detail_path, detailed_verts, basic_mesh.faces))
     
-    print(f"Generated: {len(detailed_mesh.vertices)} vertices")
+    print(f"Generated: {len(detailed_verts)} vertices")
     print(f"Quality: Organic surface texture, less 'plasticky'")
     print(f"Improvement: Subtle variations mimic biological complexity")
     print(f"Exported: {detail_path}")
@@ -165,12 +170,10 @@ def demonstrate_progression():
         scale_factors=np.array([1.0, 1.2, 1.0])  # Taller, compensate width
     )
     
-    vp_mesh = trimesh.Trimesh(vertices=vp_verts, faces=basic_mesh.faces)
-    
     vp_path = os.path.join(output_dir, 'level4_volume_preserving.obj')
-    vp_mesh.export(vp_path)
+    exports.append(io_pool.submit(write_obj_fast, vp_path, vp_verts, basic_mesh.faces))
     
-    print(f"Generated: {len(vp_mesh.vertices)} vertices")
+    print(f"Generated: {len(vp_verts)} vertices")
     print(f"Quality: Natural-looking proportions with physical plausibility")
     print(f"Improvement: Deformations respect mass conservation")
     print(f"Exported: {vp_path}")
@@ -205,20 +208,24 @@ def demonstrate_progression():
         
         # Apply blend shapes
         shapes = adv_model.create_smpl_blend_shapes(base.vertices)
-        verts = adv_model.apply_blend_shapes(base.vertices, shapes, config['weights'])
+        verts = base.vertices + np.einsum('s,svc->vc', config['weights'], shapes, optimize=True)
         
         # Add detail
-        normals = trimesh.Trimesh(vertices=verts, faces=base.faces).vertex_normals
+        normals = compute_vertex_normals(verts, base.faces)
         verts = adv_model.add_organic_detail(verts, normals, 0.004, 12.0)
         
         # Export
-        mesh = trimesh.Trimesh(vertices=verts, faces=base.faces)
         path = os.path.join(output_dir, f'advanced_{body_type}.obj')
-        mesh.export(path)
+        exports.append(io_pool.submit(write_obj_fast, path, verts, base.faces))
         
-        print(f"  Vertices: {len(mesh.vertices)}")
+        print(f"  Vertices: {len(verts)}")
         print(f"  Exported: {path}")
     
+    # Wait for pending writes and surface any I/O errors
+    io_pool.shutdown(wait=True)
+    for future in exports:
+        future.result()
+    
     # ========================================================================
     # SUMMARY
     # ========================================================================
@@ -8,10 +8,15 @@ This script generates meshes for all available presets to see the variety.
 
 import sys
 import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.params import PRESETS, get_preset
-from src.mesh import generate_base_mesh
+from src.mesh import generate_base_mesh, write_obj_fast
+
+# trimesh debug logging only adds per-mesh overhead in these batch scripts
+logging.getLogger('trimesh').setLevel(logging.WARNING)
 
 
 def main():
@@ -25,6 +30,10 @@ def main():
     
     results = []
     
+    # Overlap OBJ writes with generation of the next preset
+    io_pool = ThreadPoolExecutor(max_workers=2)
+    exports = []
+    
     for preset_name in PRESETS.keys():
         print(f"\nGenerating: {preset_name}")
         print("-" * 70)
@@ -44,7 +53,7 @@ def main():
         
         # Export
         output_path = os.path.join(output_dir, f'{preset_name}.obj')
-        mesh.export(output_path)
+        exports.append(io_pool.submit(write_obj_fast, output_path, mesh.vertices, mesh.faces))
         
         print(f"  ✅ Saved: {output_path}")
         print(f"     Vertices: {len(mesh.vertices)}, Faces: {len(mesh.faces)}")
@@ -56,6 +65,11 @@ def main():
             'faces': len(mesh.faces)
         })
     
+    # Wait for pending writes and surface any I/O errors
+    io_pool.shutdown(wait=True)
+    for future in exports:
+        future.result()
+    
     # Summary table
     print("\n" + "=" * 70)
     print("SUMMARY")
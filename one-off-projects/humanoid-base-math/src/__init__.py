@@ -20,9 +20,18 @@ Usage:
 __version__ = '0.1.0'
 __author__ = 'MMORPG Character Creator Team'
 
-from .params import HumanoidParams
-from .mesh import generate_base_mesh
-
 __all__ = ['HumanoidParams', 'generate_base_mesh']
 
 
+def __getattr__(name):
+    # Resolve exports lazily (PEP 562) so importing a single submodule does
+    # not drag in trimesh/scipy through the package __init__.
+    if name == 'HumanoidParams':
+        from .params import HumanoidParams
+        return HumanoidParams
+    if name == 'generate_base_mesh':
+        from .mesh import generate_base_mesh
+        return generate_base_mesh
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
@@ -17,11 +17,53 @@ Version: 2.0 - Advanced
 Date: October 2025
 """
 
+import functools
+import hashlib
 import numpy as np
+import scipy.sparse as sp
 from scipy.interpolate import BSpline, splprep, splev
 from typing import Tuple, List, Optional, Callable
-import warnings
-warnings.filterwarnings('ignore')
+
+# Per-model caches keyed on mesh contents hold at most this many entries
+_MESH_CACHE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=32)
+def _clamped_knot_vector(n_control_points: int, degree: int) -> np.ndarray:
+    """Clamped uniform knot vector; read-only because it is shared."""
+    n_knots = n_control_points + degree + 1
+    knots = np.zeros(n_knots)
+    
+    # Clamped (repeated at ends)
+    for i in range(degree + 1):
+        knots[i] = 0
+        knots[-(i + 1)] = 1
+    
+    # Uniform in middle
+    interior = n_knots - 2 * (degree + 1)
+    if interior > 0:
+        knots[degree + 1:degree + 1 + interior] = np.linspace(0, 1, interior + 2)[1:-1]
+    
+    knots.setflags(write=False)
+    return knots
+
+
+@functools.lru_cache(maxsize=32)
+def _unit_samples(resolution: int) -> np.ndarray:
+    """Uniform parameter samples on [0, 1]; read-only because it is shared."""
+    samples = np.linspace(0, 1, resolution)
+    samples.setflags(write=False)
+    return samples
+
+
+# Gradient directions for Perlin noise: the 12 cube-edge midpoints, padded to
+# 16 so a 4-bit hash can index them directly
+_GRADIENTS_3D = np.array([
+    [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],
+    [1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],
+    [0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1],
+    [1, 1, 0], [-1, 1, 0], [0, -1, 1], [0, -1, -1],
+], dtype=np.float64)
 
 
 class AdvancedMathematicalModel:
@@ -32,6 +74,11 @@ class AdvancedMathematicalModel:
     
     def __init__(self):
         self.noise_seed = 42
+        self._blend_stack = None
+        self._blend_shape_cache = {}  # base vertices key -> (10, N, 3) stack
+        self._subdivision_cache = {}  # topology key -> (S, new_faces)
+        self._perm = None  # Gradient noise permutation table (built on first use)
+        self._basis_cache = {}  # (control points, degree, resolution) -> basis table
         np.random.seed(self.noise_seed)
     
     # ============================================================================
@@ -51,17 +98,37 @@ class AdvancedMathematicalModel:
             n_shapes: Number of blend shapes to generate
             
         Returns:
-            List of blend shape deltas (each Nx3)
+            List of blend shape deltas (each Nx3, read-only)
         """
-        n_verts = len(base_vertices)
+        # The deltas depend only on base_vertices, so repeated humanoids
+        # built on the same base reuse one computed stack
+        key = (base_vertices.shape, base_vertices.dtype.str,
+               hashlib.blake2b(base_vertices.tobytes(), digest_size=16).digest())
+        stack = self._blend_shape_cache.get(key)
+        if stack is None:
+            stack = self._compute_blend_shapes(base_vertices)
+            stack.setflags(write=False)
+            if len(self._blend_shape_cache) >= _MESH_CACHE_SIZE:
+                # Evict the oldest entry
+                del self._blend_shape_cache[next(iter(self._blend_shape_cache))]
+            self._blend_shape_cache[key] = stack
+        
+        # Keep one contiguous (K, N, 3) stack so apply_blend_shapes can
+        # contract all shapes in a single pass; callers still get a list.
+        self._blend_stack = stack[:n_shapes]
+        return list(self._blend_stack)
+    
+    def _compute_blend_shapes(self, base_vertices: np.ndarray) -> np.ndarray:
+        """Compute all ten blend shape deltas as a 10xNx3 array."""
         blend_shapes = []
         
         # Height-based influence for different blend shapes
         y_coords = base_vertices[:, 1]
         y_normalized = (y_coords - y_coords.min()) / (y_coords.max() - y_coords.min())
         
-        # Radial distance from center
-        radial_dist = np.sqrt(base_vertices[:, 0]**2 + base_vertices[:, 2]**2)
+        # Radial distance from center (squared form for threshold tests)
+        radial_sq = base_vertices[:, 0]**2 + base_vertices[:, 2]**2
+        radial_dist = np.sqrt(radial_sq)
         
         # Shape 1: Overall size (height + width)
         shape1 = base_vertices * 0.1
@@ -106,13 +173,11 @@ class AdvancedMathematicalModel:
         
         # Shape 8: Muscle bulk (radial expansion)
         shape8 = np.zeros_like(base_vertices)
-        limb_mask = radial_dist > np.percentile(radial_dist, 50)
-        for i in range(n_verts):
-            if limb_mask[i]:
-                direction = base_vertices[i] - np.array([0, base_vertices[i, 1], 0])
-                direction_norm = np.linalg.norm(direction)
-                if direction_norm > 0:
-                    shape8[i] = direction / direction_norm * 0.05
+        direction = base_vertices.copy()
+        direction[:, 1] = 0  # Horizontal direction away from the Y axis
+        limb_mask = (radial_dist > np.percentile(radial_dist, 50)) & (radial_sq > 0)
+        scale = 0.05 / radial_dist[limb_mask]  # One divide per vertex, not per component
+        shape8[limb_mask] = direction[limb_mask] * scale[:, np.newaxis]
         blend_shapes.append(shape8)
         
         # Shape 9: Head size
@@ -125,14 +190,13 @@ class AdvancedMathematicalModel:
         
         # Shape 10: Limb thickness variation
         shape10 = np.zeros_like(base_vertices)
-        for i in range(n_verts):
-            if radial_dist[i] > 0.1:
-                radial_factor = np.sin(y_coords[i] * 3) * 0.02
-                shape10[i, 0] = base_vertices[i, 0] * radial_factor
-                shape10[i, 2] = base_vertices[i, 2] * radial_factor
+        thick_mask = radial_sq > 0.1 ** 2
+        radial_factor = np.sin(y_coords[thick_mask] * 3) * 0.02
+        shape10[thick_mask, 0] = base_vertices[thick_mask, 0] * radial_factor
+        shape10[thick_mask, 2] = base_vertices[thick_mask, 2] * radial_factor
         blend_shapes.append(shape10)
         
-        return blend_shapes[:n_shapes]
+        return np.stack(blend_shapes)
     
     def apply_blend_shapes(self, base_vertices: np.ndarray,
                           blend_shapes: List[np.ndarray],
@@ -144,19 +208,54 @@ class AdvancedMathematicalModel:
         
         Args:
             base_vertices: Base mesh (Nx3)
-            blend_shapes: List of blend shape deltas
+            blend_shapes: List of blend shape deltas, or a stacked KxNx3 array
             weights: Weight for each blend shape
             
         Returns:
             Deformed vertices
         """
-        result = base_vertices.copy()
+        shapes = self._stack_blend_shapes(blend_shapes)
+        k = min(len(shapes), len(weights))
+        
+        return base_vertices + np.tensordot(np.asarray(weights[:k]), shapes[:k], axes=1)
+    
+    def apply_blend_shapes_batch(self, base_vertices: np.ndarray,
+                                 blend_shapes: List[np.ndarray],
+                                 weights: np.ndarray) -> np.ndarray:
+        """
+        Apply blend shapes for many humanoids sharing one base mesh.
         
-        for i, (blend_shape, weight) in enumerate(zip(blend_shapes, weights)):
-            if abs(weight) > 1e-6:  # Skip negligible weights
-                result += blend_shape * weight
+        All H weight vectors are applied with a single (H x K) @ (K x 3N)
+        matrix product instead of H separate apply_blend_shapes calls.
+        Shares the cached shape stack from create_smpl_blend_shapes.
         
-        return result
+        Args:
+            base_vertices: Base mesh (Nx3)
+            blend_shapes: List of blend shape deltas, or a stacked KxNx3 array
+            weights: HxK weights, one row per humanoid
+            
+        Returns:
+            HxNx3 deformed vertices
+        """
+        shapes = self._stack_blend_shapes(blend_shapes)
+        weights = np.atleast_2d(weights)
+        k = min(len(shapes), weights.shape[1])
+        
+        offsets = weights[:, :k] @ shapes[:k].reshape(k, -1)
+        return base_vertices[np.newaxis] + offsets.reshape((len(weights),) + base_vertices.shape)
+    
+    def _stack_blend_shapes(self, blend_shapes) -> np.ndarray:
+        """Return blend shapes as a KxNx3 array, reusing the cached stack."""
+        if isinstance(blend_shapes, np.ndarray):
+            return blend_shapes
+        
+        stack = self._blend_stack
+        if (stack is not None and len(blend_shapes) == len(stack)
+                and all(shape.shape == row.shape and shape.ctypes.data == row.ctypes.data
+                        for shape, row in zip(blend_shapes, stack))):
+            return stack
+        
+        return np.stack(blend_shapes)
     
     # ============================================================================
     # NURBS (Non-Uniform Rational B-Splines)
@@ -184,77 +283,86 @@ class AdvancedMathematicalModel:
         if weights is None:
             weights = np.ones((m, n))
         
-        # Create knot vectors (clamped)
+        # Clamped knot vectors; degree is limited by control points
         degree = 3
-        knots_u = self._create_knot_vector(m, degree)
-        knots_v = self._create_knot_vector(n, degree)
+        p = min(degree, m - 1)
+        q = min(degree, n - 1)
         
-        # Sample surface
-        u_vals = np.linspace(0, 1, resolution)
-        v_vals = np.linspace(0, 1, resolution)
+        # Basis tables for uniform samples in each direction: B_u[i, a] is
+        # the weight of control row a at the i-th u sample. They depend only
+        # on (control points, degree, resolution), so they are cached.
+        B_u = self._basis_table(m, p, resolution)
+        B_v = self._basis_table(n, q, resolution)
         
-        surface_points = np.zeros((resolution, resolution, 3))
+        # Rational surface in homogeneous form: contract weighted poles and
+        # weights against both tables for the whole grid at once
+        weighted_poles = control_grid * weights[:, :, np.newaxis]
+        numerator = np.einsum('ia,jb,abk->ijk', B_u, B_v, weighted_poles, optimize=True)
+        denominator = B_u @ weights @ B_v.T
         
-        for i, u in enumerate(u_vals):
-            for j, v in enumerate(v_vals):
-                point = self._evaluate_nurbs_point(
-                    control_grid, weights, knots_u, knots_v, u, v, degree
-                )
-                surface_points[i, j] = point
+        surface_points = np.zeros((resolution, resolution, 3))
+        valid = denominator > 0
+        surface_points[valid] = numerator[valid] / denominator[valid, np.newaxis]
         
         return surface_points
     
     def _create_knot_vector(self, n_control_points: int, degree: int) -> np.ndarray:
-        """Create a clamped uniform knot vector."""
-        n_knots = n_control_points + degree + 1
-        knots = np.zeros(n_knots)
-        
-        # Clamped (repeated at ends)
-        for i in range(degree + 1):
-            knots[i] = 0
-            knots[-(i + 1)] = 1
-        
-        # Uniform in middle
-        interior = n_knots - 2 * (degree + 1)
-        if interior > 0:
-            knots[degree + 1:degree + 1 + interior] = np.linspace(0, 1, interior + 2)[1:-1]
-        
-        return knots
-    
-    def _evaluate_nurbs_point(self, control_grid: np.ndarray, weights: np.ndarray,
-                             knots_u: np.ndarray, knots_v: np.ndarray,
-                             u: float, v: float, degree: int) -> np.ndarray:
-        """Evaluate NURBS surface at (u,v) parameter."""
-        m, n, _ = control_grid.shape
-        
-        # Cox-de Boor recursion for B-spline basis functions
-        def basis_function(i, p, u, knots):
-            if p == 0:
-                return 1.0 if knots[i] <= u < knots[i + 1] else 0.0
-            
-            # Avoid division by zero
-            denom1 = knots[i + p] - knots[i]
-            denom2 = knots[i + p + 1] - knots[i + 1]
-            
-            term1 = 0.0 if denom1 == 0 else ((u - knots[i]) / denom1) * basis_function(i, p - 1, u, knots)
-            term2 = 0.0 if denom2 == 0 else ((knots[i + p + 1] - u) / denom2) * basis_function(i + 1, p - 1, u, knots)
-            
-            return term1 + term2
-        
-        # Calculate rational basis
-        numerator = np.zeros(3)
-        denominator = 0.0
+        """Create a clamped uniform knot vector (cached, read-only)."""
+        return _clamped_knot_vector(n_control_points, degree)
+    
+    def _basis_table(self, n_control_points: int, degree: int,
+                     resolution: int) -> np.ndarray:
+        """Cached (resolution x n_control_points) basis table on [0, 1]."""
+        key = (n_control_points, degree, resolution)
+        table = self._basis_cache.get(key)
+        if table is None:
+            knots = self._create_knot_vector(n_control_points, degree)
+            table = self._basis_matrix(_unit_samples(resolution), knots, degree, n_control_points)
+            table.setflags(write=False)
+            self._basis_cache[key] = table
+        return table
+    
+    def _basis_matrix(self, params: np.ndarray, knots: np.ndarray,
+                      degree: int, n_control_points: int) -> np.ndarray:
+        """Dense (len(params) x n_control_points) table of B-spline basis values."""
+        basis = np.zeros((len(params), n_control_points))
+        for i, u in enumerate(params):
+            span, N = self._basis_span(u, knots, degree)
+            basis[i, span - degree:span + 1] = N
+        return basis
+    
+    def _basis_span(self, u: float, knots: np.ndarray, degree: int) -> Tuple[int, np.ndarray]:
+        """
+        Find the knot span containing u and its non-zero B-spline basis values.
         
-        for i in range(m):
-            for j in range(n):
-                N_u = basis_function(i, min(degree, m - 1), u, knots_u)
-                N_v = basis_function(j, min(degree, n - 1), v, knots_v)
-                R = N_u * N_v * weights[i, j]
-                
-                numerator += R * control_grid[i, j]
-                denominator += R
+        Iterative Cox-de Boor triangle (Piegl & Tiller, A2.1/A2.2): O(p^2)
+        per parameter value instead of the exponential recursive form.
         
-        return numerator / denominator if denominator > 0 else np.zeros(3)
+        Returns:
+            (span, N) where N[r] is the basis value of control point span-degree+r
+        """
+        n = len(knots) - degree - 2  # Index of last control point
+        if u >= knots[n + 1]:
+            span = n
+        else:
+            span = int(np.searchsorted(knots, u, side='right')) - 1
+        
+        N = np.zeros(degree + 1)
+        left = np.zeros(degree + 1)
+        right = np.zeros(degree + 1)
+        N[0] = 1.0
+        
+        for j in range(1, degree + 1):
+            left[j] = u - knots[span + 1 - j]
+            right[j] = knots[span + j] - u
+            saved = 0.0
+            for r in range(j):
+                temp = N[r] / (right[r + 1] + left[j - r])
+                N[r] = saved + right[r + 1] * temp
+                saved = left[j - r] * temp
+            N[j] = saved
+        
+        return span, N
     
     # ============================================================================
     # FRACTAL AND NOISE-BASED DETAILING
@@ -263,7 +371,8 @@ class AdvancedMathematicalModel:
     def perlin_noise_3d(self, positions: np.ndarray,
                         scale: float = 1.0,
                         octaves: int = 4,
-                        persistence: float = 0.5) -> np.ndarray:
+                        persistence: float = 0.5,
+                        method: str = 'trig') -> np.ndarray:
         """
         Generate 3D Perlin-like noise for organic detailing.
         
@@ -275,28 +384,95 @@ class AdvancedMathematicalModel:
             scale: Frequency scale
             octaves: Number of noise layers
             persistence: Amplitude decay per octave
+            method: 'trig' for the sin-product approximation, 'grad' for
+                true gradient (Perlin) noise from a permutation table
             
         Returns:
             N array of noise values
         """
-        noise = np.zeros(len(positions))
-        amplitude = 1.0
-        frequency = scale
-        
-        for octave in range(octaves):
-            # Simple trigonometric noise (replace with proper Perlin for production)
-            octave_noise = (
-                np.sin(positions[:, 0] * frequency + octave) *
-                np.sin(positions[:, 1] * frequency * 1.3 + octave * 2) *
-                np.sin(positions[:, 2] * frequency * 0.7 + octave * 3)
-            )
-            
-            noise += octave_noise * amplitude
-            
-            amplitude *= persistence
-            frequency *= 2.0
+        # Work in the caller's float precision (float32 halves the traffic)
+        dtype = positions.dtype if np.issubdtype(positions.dtype, np.floating) else np.dtype(np.float64)
+        
+        # Per-octave frequency, amplitude and phase offset
+        octave_idx = np.arange(octaves, dtype=dtype)
+        frequencies = scale * dtype.type(2.0) ** octave_idx
+        amplitudes = dtype.type(persistence) ** octave_idx
+        
+        if method == 'grad':
+            noise = np.zeros(len(positions), dtype=dtype)
+            for frequency, amplitude in zip(frequencies, amplitudes):
+                noise += self._gradient_noise_3d(positions * frequency) * amplitude
+            return noise
+        if method != 'trig':
+            raise ValueError(f"Unknown noise method '{method}'. Available: ['trig', 'grad']")
+        
+        # Simple trigonometric noise (replace with proper Perlin for production).
+        # All octaves are evaluated together as NxO phase grids, so there is
+        # one sin call per axis rather than three per octave.
+        octave_noise = positions[:, 0:1] * frequencies
+        octave_noise += octave_idx
+        np.sin(octave_noise, out=octave_noise)
+        
+        phase = positions[:, 1:2] * frequencies
+        phase *= 1.3
+        phase += octave_idx * 2
+        octave_noise *= np.sin(phase, out=phase)
+        
+        np.multiply(positions[:, 2:3], frequencies, out=phase)
+        phase *= 0.7
+        phase += octave_idx * 3
+        octave_noise *= np.sin(phase, out=phase)
+        
+        # Weighted sum over octaves
+        return octave_noise @ amplitudes
+    
+    def _gradient_noise_3d(self, positions: np.ndarray) -> np.ndarray:
+        """
+        Single octave of Ken Perlin's improved gradient noise.
         
-        return noise
+        Corner gradients come from a 512-entry permutation table and the
+        12 cube-edge directions, so each sample is table lookups, dot
+        products and lerps rather than transcendental calls.
+        """
+        if self._perm is None:
+            rng = np.random.default_rng(self.noise_seed)
+            self._perm = np.tile(rng.permutation(256), 2)
+        perm = self._perm
+        
+        gradients = _GRADIENTS_3D.astype(positions.dtype, copy=False)
+        
+        cell = np.floor(positions)
+        frac = positions - cell
+        X, Y, Z = (cell.astype(np.int64) & 255).T
+        x, y, z = frac.T
+        
+        # Quintic fade curves
+        u, v, w = (frac ** 3 * (frac * (frac * 6 - 15) + 10)).T
+        
+        # Hash the 8 cube corners
+        A = perm[X] + Y
+        AA = perm[A] + Z
+        AB = perm[A + 1] + Z
+        B = perm[X + 1] + Y
+        BA = perm[B] + Z
+        BB = perm[B + 1] + Z
+        
+        def grad(h, gx, gy, gz):
+            g = gradients[h & 15]
+            return g[:, 0] * gx + g[:, 1] * gy + g[:, 2] * gz
+        
+        def lerp(t, a, b):
+            return a + t * (b - a)
+        
+        x1, y1, z1 = x - 1, y - 1, z - 1
+        
+        return lerp(w,
+                    lerp(v,
+                         lerp(u, grad(perm[AA], x, y, z), grad(perm[BA], x1, y, z)),
+                         lerp(u, grad(perm[AB], x, y1, z), grad(perm[BB], x1, y1, z))),
+                    lerp(v,
+                         lerp(u, grad(perm[AA + 1], x, y, z1), grad(perm[BA + 1], x1, y, z1)),
+                         lerp(u, grad(perm[AB + 1], x, y1, z1), grad(perm[BB + 1], x1, y1, z1))))
     
     def add_organic_detail(self, vertices: np.ndarray,
                           normals: np.ndarray,
@@ -325,15 +501,20 @@ class AdvancedMathematicalModel:
             persistence=0.5
         )
         
-        # Normalize noise to [-1, 1]
-        if noise.std() > 0:
-            noise = (noise - noise.mean()) / noise.std()
-        noise = np.clip(noise, -2, 2) / 2
+        # Normalize noise to [-1, 1] in place (noise is our own buffer)
+        std = noise.std()
+        if std > 0:
+            noise -= noise.mean()
+            noise /= std
+        np.clip(noise, -2, 2, out=noise)
+        noise *= detail_amplitude / 2
         
-        # Displace along normals
-        displacement = normals * (noise[:, np.newaxis] * detail_amplitude)
+        # Displace along normals, writing straight into the result
+        result = np.empty(vertices.shape, dtype=np.result_type(vertices, normals, noise))
+        np.multiply(normals, noise[:, np.newaxis], out=result)
+        result += vertices
         
-        return vertices + displacement
+        return result
     
     def add_muscle_striations(self, vertices: np.ndarray,
                              normals: np.ndarray,
@@ -344,17 +525,31 @@ class AdvancedMathematicalModel:
         
         Simulates muscle fiber patterns using oriented noise.
         """
-        # Project positions onto direction
-        projection = vertices @ direction
-        
-        # Create striations perpendicular to muscle direction
+        # Project positions onto direction. Axis-aligned directions (the
+        # common case) reduce to a column view instead of a matmul.
+        direction = np.asarray(direction)
+        axis = int(np.argmax(np.abs(direction)))
+        if np.count_nonzero(direction) == 1:
+            projection = vertices[:, axis]
+            if direction[axis] != 1:
+                projection = projection * direction[axis]
+        else:
+            projection = vertices @ direction
+        
+        # Create striations perpendicular to muscle direction. The first
+        # multiply allocates (projection may be a view of vertices); the
+        # rest reuse that buffer.
         striation_freq = 20.0
-        striations = np.sin(projection * striation_freq) * strength
+        striations = np.multiply(projection, striation_freq)
+        np.sin(striations, out=striations)
+        striations *= strength
         
-        # Apply along normals
-        displacement = normals * striations[:, np.newaxis]
+        # Apply along normals, writing straight into the result
+        result = np.empty(vertices.shape, dtype=np.result_type(vertices, normals, striations))
+        np.multiply(normals, striations[:, np.newaxis], out=result)
+        result += vertices
         
-        return vertices + displacement
+        return result
     
     # ============================================================================
     # VOLUME-PRESERVING DEFORMATIONS
@@ -418,72 +613,227 @@ class AdvancedMathematicalModel:
     def _subdivide_once(self, vertices: np.ndarray,
                        faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """Single Catmull-Clark subdivision step."""
-        n_verts = len(vertices)
-        n_faces = len(faces)
+        # Every new point is a fixed linear combination of the old ones, so
+        # the step is V_new = S @ V with S depending only on topology
+        S, new_faces = self._subdivision_topology(faces, len(vertices))
+        return S @ vertices, new_faces
+    
+    def _subdivision_topology(self, faces: np.ndarray,
+                              n_verts: int) -> Tuple[sp.csr_matrix, np.ndarray]:
+        """
+        Build (or fetch from cache) the subdivision matrix and new faces.
+        
+        Rows of S, in output order:
+        1. Original vertices (identity; simplified CC leaves them in place)
+        2. Face points (average of face vertices)
+        3. Edge points (edge midpoint; full CC would also use adjacent faces)
         
-        # Build edge map
-        edges = {}  # (v1, v2) -> edge_index
-        edge_list = []
+        Returns:
+            (S, new_faces) with S of shape (n_verts + n_faces + n_edges, n_verts)
+        """
+        key = (n_verts, faces.shape, faces.dtype.str,
+               hashlib.blake2b(faces.tobytes(), digest_size=16).digest())
+        cached = self._subdivision_cache.get(key)
+        if cached is not None:
+            return cached
         
-        for face in faces:
-            for i in range(4):
-                v1, v2 = face[i], face[(i + 1) % 4]
-                edge = tuple(sorted([v1, v2]))
-                if edge not in edges:
-                    edges[edge] = len(edge_list)
-                    edge_list.append(edge)
+        n_faces, corners = faces.shape
         
+        # Build edge map: edge_list[k] = (v1, v2) and edge_of_face[f, i] is
+        # the edge from corner i to corner i+1 of face f
+        edge_list, edge_of_face = self._build_edge_map(faces, n_verts)
         n_edges = len(edge_list)
         
-        # Calculate new points
-        # 1. Face points (average of face vertices)
-        face_points = np.zeros((n_faces, 3))
-        for i, face in enumerate(faces):
-            face_points[i] = np.mean(vertices[face], axis=0)
+        # Fill the COO triplets block by block into preallocated arrays
+        n_entries = n_verts + n_faces * corners + n_edges * 2
+        rows = np.empty(n_entries, dtype=np.int64)
+        cols = np.empty(n_entries, dtype=np.int64)
+        data = np.empty(n_entries)
+        
+        face_block = slice(n_verts, n_verts + n_faces * corners)
+        edge_block = slice(face_block.stop, n_entries)
+        
+        rows[:n_verts] = np.arange(n_verts)
+        cols[:n_verts] = rows[:n_verts]
+        data[:n_verts] = 1.0
         
-        # 2. Edge points (average of edge endpoints and adjacent face points)
-        edge_points = np.zeros((n_edges, 3))
-        for i, (v1, v2) in enumerate(edge_list):
-            edge_midpoint = (vertices[v1] + vertices[v2]) / 2
-            # Simplified: just use midpoint (full CC needs adjacent faces)
-            edge_points[i] = edge_midpoint
+        rows[face_block] = n_verts + np.repeat(np.arange(n_faces), corners)
+        cols[face_block] = faces.ravel()
+        data[face_block] = 1.0 / corners
         
-        # 3. Updated original vertices (simplified CC)
-        new_verts = []
-        new_verts.extend(vertices)  # Original (will be updated)
-        new_verts.extend(face_points)  # Face points
-        new_verts.extend(edge_points)  # Edge points
+        rows[edge_block] = n_verts + n_faces + np.repeat(np.arange(n_edges), 2)
+        cols[edge_block] = edge_list.ravel()
+        data[edge_block] = 0.5
         
-        new_verts = np.array(new_verts)
+        S = sp.csr_matrix((data, (rows, cols)), shape=(n_verts + n_faces + n_edges, n_verts))
         
         # Generate new faces (each old face becomes 4 new faces)
-        new_faces = []
-        for f_idx, face in enumerate(faces):
-            face_point_idx = n_verts + f_idx
-            
-            for i in range(4):
-                v1 = face[i]
-                v2 = face[(i + 1) % 4]
-                
-                edge = tuple(sorted([v1, v2]))
-                edge_point_idx = n_verts + n_faces + edges[edge]
-                
-                # Quad: v1 -> edge_point -> face_point -> prev_edge_point
-                prev_edge = tuple(sorted([face[(i - 1) % 4], v1]))
-                prev_edge_point_idx = n_verts + n_faces + edges[prev_edge]
-                
-                new_faces.append([v1, edge_point_idx, face_point_idx, prev_edge_point_idx])
-        
-        return new_verts, np.array(new_faces)
+        # Quad per corner: v1 -> edge_point -> face_point -> prev_edge_point
+        new_faces = np.empty((n_faces, corners, 4), dtype=np.int64)
+        new_faces[:, :, 0] = faces
+        new_faces[:, :, 1] = n_verts + n_faces + edge_of_face
+        new_faces[:, :, 2] = (n_verts + np.arange(n_faces))[:, np.newaxis]
+        new_faces[:, :, 3] = np.roll(new_faces[:, :, 1], 1, axis=1)
+        new_faces = new_faces.reshape(-1, 4)
+        
+        if len(self._subdivision_cache) >= _MESH_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._subdivision_cache[next(iter(self._subdivision_cache))]
+        self._subdivision_cache[key] = (S, new_faces)
+        return S, new_faces
+    
+    def _build_edge_map(self, faces: np.ndarray,
+                        n_verts: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Assign an index to each undirected edge of a quad mesh.
+        
+        Edges are keyed by the packed integer lo * n_verts + hi rather than
+        sorted tuples, deduplicated with np.unique, and numbered in order of
+        first appearance.
+        
+        Returns:
+            (edge_list, edge_of_face): Ex2 vertex pairs and Fx4 edge indices
+        """
+        next_corner = np.roll(faces, -1, axis=1)
+        lo = np.minimum(faces, next_corner).astype(np.int64)
+        hi = np.maximum(faces, next_corner).astype(np.int64)
+        keys = (lo * n_verts + hi).ravel()
+        
+        sorted_keys, first_seen, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        
+        # np.unique numbers edges in key order; renumber by first appearance
+        order = np.argsort(first_seen)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        
+        unique_keys = sorted_keys[order]
+        edge_list = np.column_stack([unique_keys // n_verts, unique_keys % n_verts])
+        edge_of_face = rank[inverse.ravel()].reshape(faces.shape)
+        
+        return edge_list, edge_of_face
+
+
+class GPUSubdivider:
+    """
+    Repeated Catmull-Clark subdivision of one fixed topology.
+    
+    The subdivision matrices for all iterations are composed once into a
+    single S, so each call is one sparse product. With CuPy installed and a
+    usable CUDA device, S stays resident on the GPU and only vertex data
+    crosses the bus; otherwise the same product runs through SciPy.
+    """
+    
+    def __init__(self, faces: np.ndarray, n_verts: int, iterations: int = 1,
+                 model: Optional[AdvancedMathematicalModel] = None):
+        """
+        Args:
+            faces: Mx4 quad face array of the base mesh
+            n_verts: Number of vertices in the base mesh
+            iterations: Number of subdivision steps
+            model: Model whose topology cache to use (created if omitted)
+        """
+        model = model or AdvancedMathematicalModel()
+        
+        S = sp.identity(n_verts, format='csr')
+        current_faces = faces
+        for _ in range(iterations):
+            S_step, current_faces = model._subdivision_topology(current_faces, S.shape[0])
+            S = S_step @ S
+        
+        self.S = S.tocsr()
+        self.faces = current_faces
+        self.on_gpu = False
+        try:
+            # Optional: imported here so plain `import advanced_math` never
+            # pays for CuPy; any failure (missing package, no device or
+            # driver) falls back to SciPy
+            import cupy
+            import cupyx.scipy.sparse as cupy_sparse
+            self.S_gpu = cupy_sparse.csr_matrix(self.S)
+            self._cupy = cupy
+            self.on_gpu = True
+        except Exception:
+            self.S_gpu = None
+    
+    def subdivide(self, vertices: np.ndarray) -> np.ndarray:
+        """Subdivide base vertices (Nx3) and return the refined vertices."""
+        if not self.on_gpu:
+            return self.S @ vertices
+        return (self.S_gpu @ self._cupy.asarray(vertices)).get()
+    
+    def subdivide_blended(self, base_vertices: np.ndarray,
+                          blend_stack: np.ndarray,
+                          weights: np.ndarray) -> np.ndarray:
+        """
+        Apply blend shapes and subdivide in one go: S @ (V + Σ w_i B_i).
+        
+        On the GPU the blended vertices never leave the device.
+        """
+        if not self.on_gpu:
+            return self.S @ (base_vertices + np.tensordot(weights, blend_stack, axes=1))
+        
+        cupy = self._cupy
+        blended = cupy.asarray(base_vertices) + cupy.tensordot(
+            cupy.asarray(weights), cupy.asarray(blend_stack), axes=1
+        )
+        return (self.S_gpu @ blended).get()
 
 
 # Convenience functions
 
+def build_vertex_face_incidence(faces: np.ndarray, n_vertices: int) -> sp.csr_matrix:
+    """
+    Build a sparse (V x F) matrix mapping each face to the vertices it uses.
+    
+    The matrix only depends on topology, so it can be built once per mesh and
+    reused for every normal recomputation after the vertices move.
+    
+    Args:
+        faces: Fxk face index array
+        n_vertices: Number of vertices in the mesh
+        
+    Returns:
+        CSR incidence matrix (V x F)
+    """
+    n_faces, corners = faces.shape
+    rows = faces.reshape(-1)
+    cols = np.repeat(np.arange(n_faces), corners)
+    data = np.ones(len(rows))
+    return sp.csr_matrix((data, (rows, cols)), shape=(n_vertices, n_faces))
+
+
+def compute_vertex_normals(vertices: np.ndarray,
+                           faces: np.ndarray,
+                           incidence: Optional[sp.csr_matrix] = None) -> np.ndarray:
+    """
+    Compute area-weighted vertex normals.
+    
+    Args:
+        vertices: Nx3 vertex positions
+        faces: Fxk face index array (first three corners define the plane)
+        incidence: Optional precomputed matrix from build_vertex_face_incidence
+        
+    Returns:
+        Nx3 unit vertex normals (zero-area vertices get a zero normal)
+    """
+    if incidence is None:
+        incidence = build_vertex_face_incidence(faces, len(vertices))
+    
+    v0 = vertices[faces[:, 0]]
+    face_normals = np.cross(vertices[faces[:, 1]] - v0, vertices[faces[:, 2]] - v0)
+    
+    normals = incidence @ face_normals
+    norms = np.linalg.norm(normals, axis=1, keepdims=True)
+    norms[norms == 0] = 1  # Avoid division by zero
+    return normals / norms
+
+
 def enhance_mesh_with_advanced_math(vertices: np.ndarray,
                                    faces: np.ndarray,
                                    normals: Optional[np.ndarray] = None,
                                    add_detail: bool = True,
-                                   add_subdivision: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+                                   add_subdivision: bool = False,
+                                   dtype: Optional[type] = np.float32) -> Tuple[np.ndarray, np.ndarray]:
     """
     Enhance a basic mesh with advanced mathematical techniques.
     
@@ -493,30 +843,24 @@ def enhance_mesh_with_advanced_math(vertices: np.ndarray,
         normals: Optional vertex normals (calculated if not provided)
         add_detail: Add fractal organic detail
         add_subdivision: Apply Catmull-Clark subdivision
+        dtype: Float type for the detail pipeline (None keeps the input's);
+            displacements are millimetres, so float32 is plenty
         
     Returns:
         Enhanced (vertices, faces)
     """
     model = AdvancedMathematicalModel()
     
-    enhanced_verts = vertices.copy()
+    if dtype is None:
+        dtype = vertices.dtype
+    enhanced_verts = vertices.astype(dtype)
     enhanced_faces = faces.copy()
     
     # Calculate normals if not provided
     if normals is None:
-        # Simple vertex normal calculation
-        normals = np.zeros_like(vertices)
-        for face in faces:
-            if len(face) >= 3:
-                v0, v1, v2 = vertices[face[0]], vertices[face[1]], vertices[face[2]]
-                normal = np.cross(v1 - v0, v2 - v0)
-                for v_idx in face:
-                    normals[v_idx] += normal
-        
-        # Normalize
-        norms = np.linalg.norm(normals, axis=1, keepdims=True)
-        norms[norms == 0] = 1  # Avoid division by zero
-        normals = normals / norms
+        normals = compute_vertex_normals(vertices, faces)
+    
+    normals = normals.astype(dtype, copy=False)
     
     # Add organic detail
     if add_detail:
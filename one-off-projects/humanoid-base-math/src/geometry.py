@@ -2,11 +2,39 @@
 Core Geometry Functions - Mathematical primitives for mesh generation
 """
 
+import functools
+import hashlib
 import numpy as np
+import scipy.sparse as sp
 from scipy.interpolate import splprep, splev, CubicSpline
 from typing import Tuple, List, Optional
 import warnings
-warnings.filterwarnings('ignore', category=RuntimeWarning)
+
+# Storage dtypes for generated meshes: half the bytes of NumPy's float64/int64
+# defaults, and what GPU vertex/index buffers expect
+DTYPE_V = np.float32
+DTYPE_F = np.int32
+
+
+def _linear_resample(points: np.ndarray, num_samples: int) -> np.ndarray:
+    """
+    Sample a polyline at evenly spaced point-index positions.
+    
+    Args:
+        points: NxD array of polyline points
+        num_samples: Number of points to sample
+        
+    Returns:
+        num_samples x D array of points
+    """
+    indices = np.linspace(0, len(points) - 1, num_samples)
+    source = np.arange(len(points))
+    
+    # One np.interp per coordinate, written into a single output array
+    out = np.empty((num_samples, points.shape[1]))
+    for i in range(points.shape[1]):
+        out[:, i] = np.interp(indices, source, points[:, i])
+    return out
 
 
 def generate_spline_curve(points: np.ndarray, num_samples: int = 50, closed: bool = False) -> np.ndarray:
@@ -21,40 +49,100 @@ def generate_spline_curve(points: np.ndarray, num_samples: int = 50, closed: boo
     Returns:
         Smooth curve as array of points
     """
+    points = np.asarray(points, dtype=float)
+    
     if closed:
         # Add first point to end to close the loop
         points = np.vstack([points, points[0:1]])
     
-    if points.shape[0] < 4:
-        # Not enough points for spline, use linear interpolation
-        t = np.linspace(0, 1, num_samples)
-        indices = np.linspace(0, len(points) - 1, num_samples)
-        return np.array([
-            np.interp(indices, np.arange(len(points)), points[:, i])
-            for i in range(points.shape[1])
-        ]).T
+    if points.shape[0] < 4 or _is_uniform_line(points):
+        # Not enough points for spline (or the spline would be this same
+        # straight line), use linear interpolation
+        return _linear_resample(points, num_samples)
     
     try:
+        points = np.ascontiguousarray(points)
+        return _sample_spline(points.tobytes(), points.shape, num_samples).copy()
+    
+    except Exception as e:
+        print(f"Spline fitting failed: {e}, using linear interpolation")
+        # Fallback to linear
+        return _linear_resample(points, num_samples)
+
+
+def _is_uniform_line(points: np.ndarray, tolerance: float = 1e-9) -> bool:
+    """
+    Check whether points are evenly spaced along a straight line.
+    
+    An interpolating spline reproduces such input exactly, and its chord-length
+    parameterization is uniform, so it samples identically to linear
+    interpolation.
+    """
+    second_diff = np.diff(points, n=2, axis=0)
+    return np.abs(second_diff).max() <= tolerance * np.abs(points).max()
+
+
+@functools.lru_cache(maxsize=128)
+def _sample_spline(point_bytes: bytes, shape: Tuple[int, int], num_samples: int) -> np.ndarray:
+    """Fit and sample the B-spline for generate_spline_curve; cached, so read-only."""
+    points = np.frombuffer(point_bytes).reshape(shape)
+    
+    # FITPACK warns on near-degenerate input; the fit is still usable, so
+    # silence that here only rather than process-wide
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        
         # Fit B-spline
-        if points.shape[1] == 2:
-            tck, u = splprep([points[:, 0], points[:, 1]], s=0, k=min(3, len(points) - 1))
-        else:
-            tck, u = splprep([points[:, 0], points[:, 1], points[:, 2]], s=0, k=min(3, len(points) - 1))
+        tck, u = splprep(list(points.T), s=0, k=min(3, len(points) - 1))
         
         # Sample curve
         u_fine = np.linspace(0, 1, num_samples)
         smooth_points = np.array(splev(u_fine, tck)).T
-        return smooth_points
+    smooth_points.setflags(write=False)
+    return smooth_points
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_circle(segments: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(cos, sin) of `segments` evenly spaced angles; read-only because shared."""
+    theta = np.linspace(0, 2 * np.pi, segments + 1)[:-1]  # Exclude duplicate endpoint
+    cos_t, sin_t = np.cos(theta), np.sin(theta)
+    cos_t.setflags(write=False)
+    sin_t.setflags(write=False)
+    return cos_t, sin_t
+
+
+def _ring_band_faces(n_rings: int, ring_size: int, start: int = 0) -> np.ndarray:
+    """
+    Triangulate the quad band between consecutive vertex rings.
     
-    except Exception as e:
-        print(f"Spline fitting failed: {e}, using linear interpolation")
-        # Fallback to linear
-        t = np.linspace(0, 1, num_samples)
-        indices = np.linspace(0, len(points) - 1, num_samples)
-        return np.array([
-            np.interp(indices, np.arange(len(points)), points[:, i])
-            for i in range(points.shape[1])
-        ]).T
+    Rings are stored one after another starting at index `start`; each quad
+    is split into two triangles, emitted in ring-major order.
+    
+    Args:
+        n_rings: Number of rings
+        ring_size: Vertices per ring
+        start: Index of the first vertex of the first ring
+        
+    Returns:
+        ((n_rings - 1) * ring_size * 2)x3 int32 face array
+    """
+    i = np.arange(n_rings - 1)[:, None] * ring_size + start
+    j = np.arange(ring_size)[None, :]
+    jn = (j + 1) % ring_size
+    
+    # Indices of quad corners
+    v0 = i + j
+    v1 = i + jn
+    v2 = i + ring_size + jn
+    v3 = i + ring_size + j
+    
+    # Split quad into two triangles
+    faces = np.stack([
+        np.stack([v0, v1, v2], axis=-1),
+        np.stack([v0, v2, v3], axis=-1)
+    ], axis=2)
+    return np.ascontiguousarray(faces.reshape(-1, 3), dtype=DTYPE_F)
 
 
 def create_ellipse_profile(width: float, depth: float, segments: int = 16) -> np.ndarray:
@@ -69,10 +157,8 @@ def create_ellipse_profile(width: float, depth: float, segments: int = 16) -> np
     Returns:
         Nx2 array of (x, z) coordinates
     """
-    theta = np.linspace(0, 2 * np.pi, segments + 1)[:-1]  # Exclude duplicate endpoint
-    x = (width / 2) * np.cos(theta)
-    z = (depth / 2) * np.sin(theta)
-    return np.column_stack([x, z])
+    cos_t, sin_t = _unit_circle(segments)
+    return np.column_stack([(width / 2) * cos_t, (depth / 2) * sin_t]).astype(DTYPE_V)
 
 
 def loft_profile_along_curve(profile: np.ndarray, 
@@ -89,42 +175,39 @@ def loft_profile_along_curve(profile: np.ndarray,
     Returns:
         Tuple of (vertices, faces) arrays
     """
-    n_profile = len(profile)
     n_spine = len(spine_curve)
     
     if scale_along_spine is None:
         scale_along_spine = np.ones(n_spine)
     
-    # Generate vertices by sweeping profile along spine
-    vertices = []
-    for i, spine_pt in enumerate(spine_curve):
-        scale = scale_along_spine[i]
+    # Profile is in XZ plane, extrude along Y (spine): one scaled ring per spine point
+    scale = np.asarray(scale_along_spine, dtype=float)[:, None, None]
+    return loft_profile_stack_along_curve(np.asarray(profile)[None, :, :] * scale, spine_curve)
+
+
+def loft_profile_stack_along_curve(profiles: np.ndarray,
+                                   spine_curve: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Loft a different 2D profile at each spine point into one connected surface.
+    
+    Args:
+        profiles: MxNx2 array, one (x, z) cross-section per spine point
+        spine_curve: Mx3 array of (x, y, z) points defining the sweep path
         
-        # Transform profile to this position
-        # Profile is in XZ plane, extrude along Y (spine)
-        for prof_pt in profile:
-            x = spine_pt[0] + prof_pt[0] * scale
-            y = spine_pt[1]
-            z = spine_pt[2] + prof_pt[1] * scale
-            vertices.append([x, y, z])
-    
-    vertices = np.array(vertices)
-    
-    # Generate quad faces connecting rings
-    faces = []
-    for i in range(n_spine - 1):
-        for j in range(n_profile):
-            # Indices of quad corners
-            v0 = i * n_profile + j
-            v1 = i * n_profile + (j + 1) % n_profile
-            v2 = (i + 1) * n_profile + (j + 1) % n_profile
-            v3 = (i + 1) * n_profile + j
-            
-            # Split quad into two triangles
-            faces.append([v0, v1, v2])
-            faces.append([v0, v2, v3])
-    
-    return vertices, np.array(faces)
+    Returns:
+        Tuple of (vertices, faces) arrays
+    """
+    profiles = np.asarray(profiles)
+    spine_curve = np.asarray(spine_curve, dtype=float)
+    n_spine, n_profile = profiles.shape[:2]
+    
+    # Generate vertices by placing each profile around its spine point
+    x = spine_curve[:, 0:1] + profiles[:, :, 0]
+    y = np.broadcast_to(spine_curve[:, 1:2], x.shape)
+    z = spine_curve[:, 2:3] + profiles[:, :, 1]
+    vertices = np.stack([x, y, z], axis=-1, dtype=DTYPE_V).reshape(-1, 3)
+    
+    return vertices, _ring_band_faces(n_spine, n_profile)
 
 
 def create_tapered_cylinder(length: float,
@@ -145,24 +228,18 @@ def create_tapered_cylinder(length: float,
     Returns:
         Tuple of (vertices, faces)
     """
-    # Create spine (straight line)
-    spine = np.column_stack([
-        np.zeros(rings),
-        np.linspace(0, length, rings),
-        np.zeros(rings)
-    ])
-    
-    # Create circular profile
-    theta = np.linspace(0, 2 * np.pi, segments + 1)[:-1]
-    profile = np.column_stack([
-        np.cos(theta),
-        np.sin(theta)
-    ])
-    
-    # Scale factors for tapering
-    scales = np.linspace(radius_start, radius_end, rings)
-    
-    return loft_profile_along_curve(profile, spine, scales)
+    # The spine is a straight line along Y, so each ring is just the unit
+    # circle scaled by the taper and lifted to its height
+    cos_t, sin_t = _unit_circle(segments)
+    scales = np.linspace(radius_start, radius_end, rings)[:, None]
+    
+    vertices = np.empty((rings * segments, 3), dtype=DTYPE_V)
+    ring_view = vertices.reshape(rings, segments, 3)
+    ring_view[:, :, 0] = scales * cos_t
+    ring_view[:, :, 1] = np.linspace(0, length, rings)[:, None]
+    ring_view[:, :, 2] = scales * sin_t
+    
+    return vertices, _ring_band_faces(rings, segments)
 
 
 def create_sphere(radius: float, lat_segments: int = 8, lon_segments: int = 12) -> Tuple[np.ndarray, np.ndarray]:
@@ -177,59 +254,45 @@ def create_sphere(radius: float, lat_segments: int = 8, lon_segments: int = 12)
     Returns:
         Tuple of (vertices, faces)
     """
-    vertices = []
-    
-    # Top pole
-    vertices.append([0, radius, 0])
+    n_rings = lat_segments - 1
+    vertices = np.empty((2 + n_rings * lon_segments, 3), dtype=DTYPE_V)
     
-    # Latitude rings
-    for i in range(1, lat_segments):
-        lat = np.pi * i / lat_segments - np.pi / 2  # -π/2 to π/2
-        y = radius * np.sin(lat)
-        r = radius * np.cos(lat)
-        
-        for j in range(lon_segments):
-            lon = 2 * np.pi * j / lon_segments
-            x = r * np.cos(lon)
-            z = r * np.sin(lon)
-            vertices.append([x, y, z])
+    # Top and bottom poles
+    vertices[0] = [0, radius, 0]
+    vertices[-1] = [0, -radius, 0]
     
-    # Bottom pole
-    vertices.append([0, -radius, 0])
+    # Latitude rings, written straight into the (ring, lon, xyz) view
+    lat = np.pi * np.arange(1, lat_segments) / lat_segments - np.pi / 2  # -π/2 to π/2
+    ring_radius = (radius * np.cos(lat))[:, None]
+    cos_lon, sin_lon = _unit_circle(lon_segments)
     
-    vertices = np.array(vertices)
+    rings = vertices[1:-1].reshape(n_rings, lon_segments, 3)
+    rings[:, :, 0] = ring_radius * cos_lon
+    rings[:, :, 1] = (radius * np.sin(lat))[:, None]
+    rings[:, :, 2] = ring_radius * sin_lon
     
     # Generate faces
-    faces = []
+    j = np.arange(lon_segments)
+    jn = (j + 1) % lon_segments
     
-    # Top cap
-    for j in range(lon_segments):
-        v1 = 0  # Top pole
-        v2 = 1 + j
-        v3 = 1 + (j + 1) % lon_segments
-        faces.append([v1, v2, v3])
+    # Top cap: fan from the top pole around the first ring
+    top_cap = np.stack([np.zeros_like(j), 1 + j, 1 + jn], axis=-1)
     
     # Middle quads
-    for i in range(lat_segments - 2):
-        for j in range(lon_segments):
-            v0 = 1 + i * lon_segments + j
-            v1 = 1 + i * lon_segments + (j + 1) % lon_segments
-            v2 = 1 + (i + 1) * lon_segments + (j + 1) % lon_segments
-            v3 = 1 + (i + 1) * lon_segments + j
-            
-            faces.append([v0, v1, v2])
-            faces.append([v0, v2, v3])
-    
-    # Bottom cap
+    middle = _ring_band_faces(n_rings, lon_segments, start=1)
+    
+    # Bottom cap: fan from the last ring to the bottom pole
     bottom_pole = len(vertices) - 1
     bottom_ring_start = 1 + (lat_segments - 2) * lon_segments
-    for j in range(lon_segments):
-        v1 = bottom_ring_start + j
-        v2 = bottom_ring_start + (j + 1) % lon_segments
-        v3 = bottom_pole
-        faces.append([v1, v2, v3])
+    bottom_cap = np.stack([
+        bottom_ring_start + j,
+        bottom_ring_start + jn,
+        np.full_like(j, bottom_pole)
+    ], axis=-1)
+    
+    faces = np.concatenate([top_cap, middle, bottom_cap]).astype(DTYPE_F)
     
-    return vertices, np.array(faces)
+    return vertices, faces
 
 
 def create_anatomical_torso_profile(height: float, 
@@ -299,49 +362,106 @@ def mirror_vertices_x(vertices: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarr
     # Find center vertices (x ≈ 0)
     tolerance = 1e-6
     center_mask = np.abs(vertices[:, 0]) < tolerance
-    center_indices = np.where(center_mask)[0]
     
     # Separate center and side vertices
     side_mask = ~center_mask
-    side_vertices = vertices[side_mask]
+    side_indices = np.flatnonzero(side_mask)
     
     # Create mirrored side vertices
-    mirrored_side = side_vertices.copy()
+    mirrored_side = vertices[side_indices].copy()
     mirrored_side[:, 0] *= -1  # Flip X coordinate
     
     # Combine: original + mirrored
     all_vertices = np.vstack([vertices, mirrored_side])
     
-    # Create index mapping
-    old_to_new = {}
-    for i in range(len(vertices)):
-        old_to_new[i] = i
-    
-    # Map mirrored vertices
-    side_idx = 0
-    for i, is_side in enumerate(side_mask):
-        if is_side:
-            old_to_new[i + len(vertices)] = len(vertices) + side_idx
-            side_idx += 1
-    
-    # Mirror faces with flipped winding order
-    mirrored_faces = []
-    for face in faces:
-        # Check if all vertices are on the side (not center)
-        if all(not center_mask[v] for v in face):
-            # Offset indices and flip winding
-            new_face = [old_to_new.get(v + len(vertices), v) for v in face]
-            mirrored_faces.append([new_face[0], new_face[2], new_face[1]])  # Flip winding
+    # Index of each side vertex's mirrored copy
+    mirror_of = np.arange(len(vertices))
+    mirror_of[side_indices] = len(vertices) + np.arange(len(side_indices))
+    
+    # Mirror faces lying entirely on the side (no center vertices),
+    # flipping winding order
+    faces = np.asarray(faces)
+    side_faces = faces[~center_mask[faces].any(axis=1)]
+    mirrored_faces = mirror_of[side_faces][:, [0, 2, 1]]
     
     all_faces = np.vstack([faces, mirrored_faces])
     
     return all_vertices, all_faces
 
 
+def _neighbor_mean_operator(faces: np.ndarray, n_vertices: int, dtype=np.float64) -> sp.csr_matrix:
+    """
+    Build the sparse operator averaging each vertex's edge neighbors.
+    
+    Args:
+        faces: Mx3 face index array
+        n_vertices: Number of vertices
+        dtype: Value dtype of the operator
+        
+    Returns:
+        Sparse (n_vertices x n_vertices) CSR matrix with rows summing to 1
+        (or 0 for vertices not referenced by any face)
+    """
+    faces = np.asarray(faces)
+    # Each face edge (v1, v2) links both endpoints
+    v1 = faces.ravel()
+    v2 = np.roll(faces, -1, axis=1).ravel()
+    rows = np.concatenate([v1, v2])
+    cols = np.concatenate([v2, v1])
+    
+    A = sp.csr_matrix((np.ones(len(rows), dtype=dtype), (rows, cols)),
+                      shape=(n_vertices, n_vertices))
+    # Shared edges appear twice; count each neighbor once
+    A.sum_duplicates()
+    
+    degree = np.diff(A.indptr)
+    A.data = np.repeat(1.0 / np.maximum(degree, 1), degree).astype(dtype)
+    return A
+
+
+# Neighbor-mean operators keyed by topology, so repeated builds with the same
+# face layout (parameter sweeps, presets) skip the sparse construction
+_SMOOTHER_CACHE = {}
+_SMOOTHER_CACHE_SIZE = 32
+
+
+def prepare_smoother(faces: np.ndarray, n_vertices: int, dtype=np.float64) -> sp.csr_matrix:
+    """
+    Get the (cached) smoothing operator for a mesh topology.
+    
+    Meshes sharing the same faces and vertex count share one operator; pass
+    it to smooth_vertices_laplacian to skip the lookup entirely.
+    
+    Args:
+        faces: Mx3 face index array
+        n_vertices: Number of vertices
+        dtype: Value dtype of the operator (match the vertex dtype)
+        
+    Returns:
+        Read-only sparse neighbor-mean operator
+    """
+    faces = np.ascontiguousarray(faces)
+    dtype = np.dtype(dtype)
+    key = (faces.shape, faces.dtype.str, n_vertices, dtype.str,
+           hashlib.blake2b(faces.tobytes(), digest_size=16).digest())
+    
+    P = _SMOOTHER_CACHE.get(key)
+    if P is None:
+        P = _neighbor_mean_operator(faces, n_vertices, dtype)
+        for array in (P.data, P.indices, P.indptr):
+            array.setflags(write=False)
+        if len(_SMOOTHER_CACHE) >= _SMOOTHER_CACHE_SIZE:
+            # Evict the oldest entry
+            del _SMOOTHER_CACHE[next(iter(_SMOOTHER_CACHE))]
+        _SMOOTHER_CACHE[key] = P
+    return P
+
+
 def smooth_vertices_laplacian(vertices: np.ndarray, 
                                faces: np.ndarray,
                                iterations: int = 1,
-                               factor: float = 0.5) -> np.ndarray:
+                               factor: float = 0.5,
+                               operator: Optional[sp.csr_matrix] = None) -> np.ndarray:
     """
     Apply Laplacian smoothing to vertices.
     
@@ -350,35 +470,25 @@ def smooth_vertices_laplacian(vertices: np.ndarray,
         faces: Mx3 face index array
         iterations: Number of smoothing passes
         factor: Smoothing strength (0=none, 1=full)
+        operator: Optional operator from prepare_smoother(faces, ...)
         
     Returns:
         Smoothed vertex array
     """
     smoothed = vertices.copy()
     
-    # Build vertex neighbors from faces
-    neighbors = [set() for _ in range(len(vertices))]
-    for face in faces:
-        for i in range(3):
-            v1 = face[i]
-            v2 = face[(i + 1) % 3]
-            neighbors[v1].add(v2)
-            neighbors[v2].add(v1)
+    # Row-normalized vertex adjacency: (P @ V)[i] is the mean of i's neighbors
+    P = operator
+    if P is None:
+        P = prepare_smoother(faces, len(vertices), smoothed.dtype)
+    
+    # Vertices without neighbors are left where they are
+    has_neighbors = np.diff(P.indptr) > 0
+    weight = np.where(has_neighbors, factor, 0.0).astype(smoothed.dtype)[:, None]
     
     for _ in range(iterations):
-        new_positions = smoothed.copy()
-        
-        for i, vert in enumerate(smoothed):
-            if len(neighbors[i]) == 0:
-                continue
-            
-            # Average neighbor positions
-            neighbor_avg = np.mean([smoothed[n] for n in neighbors[i]], axis=0)
-            
-            # Blend original with averaged
-            new_positions[i] = vert * (1 - factor) + neighbor_avg * factor
-        
-        smoothed = new_positions
+        # Blend original with averaged
+        smoothed = smoothed * (1 - weight) + (P @ smoothed) * weight
     
     return smoothed
 
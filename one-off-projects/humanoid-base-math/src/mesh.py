@@ -10,13 +10,25 @@ from .geometry import (
     create_sphere,
     create_tapered_cylinder,
     create_ellipse_profile,
-    loft_profile_along_curve,
+    loft_profile_stack_along_curve,
     create_anatomical_torso_profile,
     mirror_vertices_x,
-    smooth_vertices_laplacian
+    smooth_vertices_laplacian,
+    DTYPE_V,
+    DTYPE_F
 )
 
 
+# Slight downward arm angle: -10 degrees about Z, shared by every build (the
+# left arm is mirrored afterwards, which negates the angle)
+_ARM_ANGLE = np.radians(-10)
+_ARM_ROTATION = np.array([
+    [np.cos(_ARM_ANGLE), -np.sin(_ARM_ANGLE), 0],
+    [np.sin(_ARM_ANGLE), np.cos(_ARM_ANGLE), 0],
+    [0, 0, 1]
+], dtype=DTYPE_V)
+
+
 class HumanoidMeshBuilder:
     """
     Builds a complete humanoid mesh from parameters using mathematical primitives.
@@ -42,12 +54,33 @@ class HumanoidMeshBuilder:
             vertices: Component vertices
             faces: Component faces (will be offset)
         """
+        vertices = np.asarray(vertices, dtype=DTYPE_V)
+        faces = np.asarray(faces, dtype=DTYPE_F)
+        
         self.all_vertices.append(vertices)
         # Offset face indices
         offset_faces = faces + self.vertex_offset
         self.all_faces.append(offset_faces)
         self.vertex_offset += len(vertices)
     
+    def _face_count(self) -> int:
+        """Total faces across the components added so far."""
+        return sum(len(faces) for faces in self.all_faces)
+    
+    @staticmethod
+    def mirror_component(vertices: np.ndarray, faces: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Mirror a component across X=0, flipping winding to keep normals outward.
+        
+        Args:
+            vertices: Component vertices
+            faces: Component faces
+            
+        Returns:
+            Tuple of (mirrored_vertices, mirrored_faces)
+        """
+        return vertices * np.array([-1, 1, 1], dtype=vertices.dtype), faces[:, [0, 2, 1]]
+    
     def build_head(self) -> Tuple[np.ndarray, np.ndarray]:
         """Generate head as UV sphere."""
         head_height = self.params.height * self.params.head_ratio
@@ -114,31 +147,8 @@ class HumanoidMeshBuilder:
             z_curve[:n_profiles]
         ])
         
-        # Loft profiles along spine
-        # Stack all profile points with proper offsets
-        all_verts = []
-        all_faces = []
-        
-        for i in range(n_profiles - 1):
-            # Loft between two profiles
-            profile1 = profiles[i]
-            profile2 = profiles[i + 1]
-            
-            # Create mini-spine between two heights
-            mini_spine = np.array([spine[i], spine[i + 1]])
-            
-            # Loft
-            verts, faces = loft_profile_along_curve(profile1, mini_spine)
-            
-            # Offset faces and add
-            if all_verts:
-                faces = faces + len(np.vstack(all_verts))
-            
-            all_verts.append(verts)
-            all_faces.append(faces)
-        
-        vertices = np.vstack(all_verts)
-        faces = np.vstack(all_faces)
+        # Loft all profiles along the spine as one connected surface
+        vertices, faces = loft_profile_stack_along_curve(np.stack(profiles), spine)
         
         return vertices, faces
     
@@ -195,20 +205,14 @@ class HumanoidMeshBuilder:
         shoulder_y = torso_height * 0.95
         
         # Rotate arm downward
-        angle = np.radians(-10)  # Slight downward angle
-        rotation = np.array([
-            [np.cos(angle), -np.sin(angle), 0],
-            [np.sin(angle), np.cos(angle), 0],
-            [0, 0, 1]
-        ])
-        
-        arm_verts = arm_verts @ rotation.T
+        arm_verts = arm_verts @ _ARM_ROTATION.T
         
         # Position
-        x_offset = shoulder_width / 2 if side == 'right' else -shoulder_width / 2
-        arm_verts[:, 0] += x_offset
+        arm_verts[:, 0] += shoulder_width / 2
         arm_verts[:, 1] += shoulder_y
         
+        if side == 'left':
+            return self.mirror_component(arm_verts, arm_faces)
         return arm_verts, arm_faces
     
     def build_leg(self, side: str = 'right') -> Tuple[np.ndarray, np.ndarray]:
@@ -263,9 +267,10 @@ class HumanoidMeshBuilder:
         
         # Position at hip
         hip_width = self.params.height * self.params.hip_width_ratio
-        x_offset = hip_width / 2 if side == 'right' else -hip_width / 2
-        leg_verts[:, 0] += x_offset
+        leg_verts[:, 0] += hip_width / 2
         
+        if side == 'left':
+            return self.mirror_component(leg_verts, leg_faces)
         return leg_verts, leg_faces
     
     def build(self, apply_symmetry: bool = True, apply_smoothing: bool = True) -> trimesh.Trimesh:
@@ -304,44 +309,36 @@ class HumanoidMeshBuilder:
         right_leg_v, right_leg_f = self.build_leg('right')
         self.add_component(right_leg_v, right_leg_f)
         
-        # Combine all
-        vertices = np.vstack(self.all_vertices)
-        faces = np.vstack(self.all_faces)
-        
-        print(f"Base mesh: {len(vertices)} vertices, {len(faces)} faces")
+        print(f"Base mesh: {self.vertex_offset} vertices, {self._face_count()} faces")
         
         # Apply symmetry
         if apply_symmetry:
-            # Note: This is simplified - proper symmetry needs center vertex detection
-            # For now, just manually add left arm/leg
-            left_arm_v, left_arm_f = self.build_arm('left')
-            left_leg_v, left_leg_f = self.build_leg('left')
+            # Left limbs are the right ones mirrored across X=0
+            self.add_component(*self.mirror_component(right_arm_v, right_arm_f))
+            self.add_component(*self.mirror_component(right_leg_v, right_leg_f))
             
-            left_arm_f += len(vertices)
-            left_leg_f += len(vertices) + len(left_arm_v)
-            
-            vertices = np.vstack([vertices, left_arm_v, left_leg_v])
-            faces = np.vstack([faces, left_arm_f, left_leg_f])
-            
-            print(f"After symmetry: {len(vertices)} vertices, {len(faces)} faces")
+            print(f"After symmetry: {self.vertex_offset} vertices, {self._face_count()} faces")
         
-        # Create mesh
-        mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        # Combine all components in a single copy
+        vertices = np.concatenate(self.all_vertices)
+        faces = np.concatenate(self.all_faces)
         
         # Apply smoothing if requested
         if apply_smoothing:
             vertices = smooth_vertices_laplacian(
-                mesh.vertices,
-                mesh.faces,
+                vertices,
+                faces,
                 iterations=1,
                 factor=0.3
             )
-            mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
             print("Smoothing applied")
         
-        # Clean up mesh
-        mesh.remove_duplicate_faces()
-        mesh.remove_degenerate_faces()
+        # Create mesh once, from the final vertices
+        mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        
+        # Clean up mesh (components are disjoint lofts and spheres, so
+        # duplicate faces cannot occur)
+        mesh.update_faces(mesh.nondegenerate_faces())
         mesh.fix_normals()
         
         print(f"Final mesh: {len(mesh.vertices)} vertices, {len(mesh.faces)} faces")
@@ -351,6 +348,24 @@ class HumanoidMeshBuilder:
         return mesh
 
 
+def write_obj_fast(path: str, vertices: np.ndarray, faces: np.ndarray):
+    """
+    Write vertices and faces to a minimal Wavefront OBJ file.
+    
+    Uses np.savetxt so formatting happens in bulk rather than line by line
+    in Python, which is noticeably faster than trimesh's OBJ exporter.
+    
+    Args:
+        path: Output file path
+        vertices: Nx3 vertex array
+        faces: Mxk face index array (0-based, written 1-based)
+    """
+    face_fmt = 'f ' + ' '.join(['%d'] * faces.shape[1])
+    with open(path, 'w') as f:
+        np.savetxt(f, vertices, fmt='v %.6f %.6f %.6f')
+        np.savetxt(f, faces + 1, fmt=face_fmt)
+
+
 def generate_base_mesh(params: HumanoidParams,
                        apply_symmetry: bool = True,
                        apply_smoothing: bool = True) -> trimesh.Trimesh:
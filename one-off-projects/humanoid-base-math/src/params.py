@@ -2,18 +2,27 @@
 Humanoid Parameters - Defines all adjustable characteristics
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+import functools
 from typing import Optional, Dict
 import json
 
+try:
+    # Optional: faster JSON encode/decode for save/load
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class HumanoidParams:
     """
     Parameters for mathematical humanoid generation.
     
     All ratios are relative to height. Stockiness affects width scaling.
     Based on Vitruvian proportions with adjustability for fantasy races.
+    Instances are immutable (presets are shared); derive variants with
+    dataclasses.replace(params, height=...).
     
     Attributes:
         height: Total height in meters (0.5 to 3.0)
@@ -89,8 +98,8 @@ class HumanoidParams:
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON export."""
         return {
-            k: v for k, v in self.__dict__.items() 
-            if not k.startswith('_')
+            f.name: getattr(self, f.name) for f in fields(self)
+            if not f.name.startswith('_')
         }
     
     @classmethod
@@ -100,34 +109,43 @@ class HumanoidParams:
     
     def save(self, filepath: str):
         """Save parameters to JSON file."""
-        with open(filepath, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        if orjson is not None:
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(self.to_dict(), f, indent=2)
     
     @classmethod
     def load(cls, filepath: str) -> 'HumanoidParams':
         """Load parameters from JSON file."""
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(filepath, 'r') as f:
+                data = json.load(f)
         return cls.from_dict(data)
 
 
-# Preset parameter sets for common body types
-PRESETS = {
-    'human_male': HumanoidParams(
+# Preset parameter sets for common body types. Only the keyword arguments are
+# stored; each HumanoidParams is built (and validated) on first use.
+PRESET_SPECS: Dict[str, Dict] = {
+    'human_male': dict(
         height=1.75,
         stockiness=1.0,
         shoulder_width_ratio=0.25,
         hip_width_ratio=0.18
     ),
     
-    'human_female': HumanoidParams(
+    'human_female': dict(
         height=1.65,
         stockiness=0.9,
         shoulder_width_ratio=0.22,
         hip_width_ratio=0.20
     ),
     
-    'dwarf': HumanoidParams(
+    'dwarf': dict(
         height=1.2,
         stockiness=1.4,
         head_ratio=0.17,  # Proportionally larger head
@@ -136,7 +154,7 @@ PRESETS = {
         shoulder_width_ratio=0.30
     ),
     
-    'elf': HumanoidParams(
+    'elf': dict(
         height=1.85,
         stockiness=0.85,
         torso_ratio=0.38,
@@ -144,7 +162,7 @@ PRESETS = {
         ear_length=0.6
     ),
     
-    'orc': HumanoidParams(
+    'orc': dict(
         height=1.95,
         stockiness=1.3,
         shoulder_width_ratio=0.32,
@@ -152,7 +170,7 @@ PRESETS = {
         head_ratio=0.14  # Larger head
     ),
     
-    'goblin': HumanoidParams(
+    'goblin': dict(
         height=1.0,
         stockiness=0.9,
         head_ratio=0.20,  # Large head for small body
@@ -161,14 +179,14 @@ PRESETS = {
         ear_length=0.8
     ),
     
-    'child': HumanoidParams(
+    'child': dict(
         height=1.2,
         stockiness=0.95,
         head_ratio=0.18,  # Larger head proportion
         limb_segments=6  # Simpler geometry
     ),
     
-    'athletic': HumanoidParams(
+    'athletic': dict(
         height=1.80,
         stockiness=1.05,
         shoulder_width_ratio=0.27,
@@ -179,6 +197,12 @@ PRESETS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _build_preset(name: str) -> HumanoidParams:
+    """Build a preset once; sharing is safe because params are frozen."""
+    return HumanoidParams(**PRESET_SPECS[name])
+
+
 def get_preset(name: str) -> HumanoidParams:
     """
     Get a preset parameter set by name.
@@ -189,9 +213,17 @@ def get_preset(name: str) -> HumanoidParams:
     Returns:
         HumanoidParams configured for that body type
     """
-    if name not in PRESETS:
-        raise ValueError(f"Unknown preset '{name}'. Available: {list(PRESETS.keys())}")
-    return PRESETS[name]
+    if name not in PRESET_SPECS:
+        raise ValueError(f"Unknown preset '{name}'. Available: {list(PRESET_SPECS.keys())}")
+    return _build_preset(name)
+
+
+def __getattr__(name):
+    # PRESETS (name -> HumanoidParams) is materialized on access (PEP 562) so
+    # importing params does not build and validate every preset up front.
+    if name == 'PRESETS':
+        return {preset: get_preset(preset) for preset in PRESET_SPECS}
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
@@ -203,7 +235,7 @@ if __name__ == "__main__":
     print(f"Default human: {human.height}m tall, stockiness={human.stockiness}")
     
     # Test presets
-    for preset_name in PRESETS:
+    for preset_name in PRESET_SPECS:
         preset = get_preset(preset_name)
         print(f"{preset_name}: {preset.height}m, {preset.stockiness:.2f}x")
     
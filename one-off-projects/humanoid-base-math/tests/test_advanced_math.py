@@ -0,0 +1,211 @@
+"""
+Unit tests for advanced mathematical models
+"""
+
+import pytest
+import numpy as np
+import sys
+import os
+import types
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+from advanced_math import AdvancedMathematicalModel, GPUSubdivider, _MESH_CACHE_SIZE
+
+
+class TestBlendShapes:
+    def test_apply_matches_weighted_sum(self):
+        """Test blend shape application is base + sum of weighted deltas"""
+        model = AdvancedMathematicalModel()
+        base = np.random.randn(200, 3)
+        shapes = model.create_smpl_blend_shapes(base, n_shapes=5)
+        weights = np.array([0.5, -0.3, 0.2, 0.0, 0.8])
+
+        deformed = model.apply_blend_shapes(base, shapes, weights)
+
+        expected = base + sum(w * shape for w, shape in zip(weights, shapes))
+        assert np.allclose(deformed, expected)
+
+    def test_batch_matches_single(self):
+        """Test batched application matches one call per weight vector"""
+        model = AdvancedMathematicalModel()
+        base = np.random.randn(80, 3)
+        shapes = model.create_smpl_blend_shapes(base)
+        weights = np.random.uniform(-1, 1, (4, 10))
+
+        batch = model.apply_blend_shapes_batch(base, shapes, weights)
+
+        assert batch.shape == (4, 80, 3)
+        for i in range(4):
+            assert np.allclose(batch[i], model.apply_blend_shapes(base, shapes, weights[i]))
+
+    def test_shapes_cached_per_base(self):
+        """Test repeated calls on the same base reuse the computed deltas"""
+        model = AdvancedMathematicalModel()
+        base = np.random.randn(50, 3)
+
+        first = model.create_smpl_blend_shapes(base)
+        second = model.create_smpl_blend_shapes(base.copy(), n_shapes=3)
+
+        assert len(second) == 3
+        assert np.shares_memory(first[0], second[0])
+        assert not first[0].flags.writeable
+
+    def test_shape_cache_bounded(self):
+        """Test the blend shape cache evicts its oldest base when full"""
+        model = AdvancedMathematicalModel()
+        bases = [np.random.randn(20, 3) for _ in range(_MESH_CACHE_SIZE + 1)]
+
+        first = model.create_smpl_blend_shapes(bases[0])
+        for base in bases[1:]:
+            model.create_smpl_blend_shapes(base)
+        again = model.create_smpl_blend_shapes(bases[0])
+
+        assert len(model._blend_shape_cache) == _MESH_CACHE_SIZE
+        assert np.allclose(first[0], again[0])
+        assert not np.shares_memory(first[0], again[0])
+
+
+class TestNoise:
+    def test_gradient_noise_zero_on_lattice(self):
+        """Test gradient noise vanishes at integer lattice points"""
+        model = AdvancedMathematicalModel()
+        lattice = np.random.randint(-10, 10, (50, 3)).astype(float)
+
+        assert np.allclose(model._gradient_noise_3d(lattice), 0.0)
+
+    def test_noise_methods(self):
+        """Test both noise methods return one bounded value per position"""
+        model = AdvancedMathematicalModel()
+        positions = np.random.rand(100, 3)
+
+        for method in ('trig', 'grad'):
+            noise = model.perlin_noise_3d(positions, scale=5.0, method=method)
+            assert noise.shape == (100,)
+            assert np.all(np.abs(noise) < 2.0)
+
+        with pytest.raises(ValueError):
+            model.perlin_noise_3d(positions, method='simplex')
+
+
+class TestNURBS:
+    def test_surface_shape(self):
+        """Test NURBS sampling grid shape"""
+        model = AdvancedMathematicalModel()
+        control_grid = np.random.randn(5, 6, 3)
+
+        surface = model.create_nurbs_surface(control_grid, resolution=7)
+
+        assert surface.shape == (7, 7, 3)
+
+    def test_clamped_corners(self):
+        """Test clamped surface interpolates its corner control points"""
+        model = AdvancedMathematicalModel()
+        control_grid = np.random.randn(6, 5, 3)
+        weights = np.random.uniform(0.5, 2.0, (6, 5))
+
+        surface = model.create_nurbs_surface(control_grid, weights, resolution=9)
+
+        assert np.allclose(surface[0, 0], control_grid[0, 0])
+        assert np.allclose(surface[0, -1], control_grid[0, -1])
+        assert np.allclose(surface[-1, 0], control_grid[-1, 0])
+        assert np.allclose(surface[-1, -1], control_grid[-1, -1])
+
+    def test_basis_partition_of_unity(self):
+        """Test B-spline basis values sum to one inside the domain"""
+        model = AdvancedMathematicalModel()
+        knots = model._create_knot_vector(7, 3)
+
+        for u in np.linspace(0, 1, 11):
+            span, N = model._basis_span(u, knots, 3)
+            assert 3 <= span <= 6
+            assert N.sum() == pytest.approx(1.0)
+
+
+class TestSubdivision:
+    def test_quad_grid_counts(self):
+        """Test one step adds a face point per face and an edge point per edge"""
+        model = AdvancedMathematicalModel()
+        # 3x3 grid of vertices -> 2x2 quads, 12 unique edges
+        idx = np.arange(9).reshape(3, 3)
+        faces = np.stack([idx[:-1, :-1], idx[:-1, 1:], idx[1:, 1:], idx[1:, :-1]], axis=-1).reshape(-1, 4)
+        vertices = np.random.randn(9, 3)
+
+        new_verts, new_faces = model.catmull_clark_subdivision(vertices, faces)
+
+        assert len(new_verts) == 9 + 4 + 12
+        assert new_faces.shape == (16, 4)
+        assert np.allclose(new_verts[:9], vertices)
+        assert np.allclose(new_verts[9], vertices[faces[0]].mean(axis=0))
+
+    def test_topology_cache_bounded(self):
+        """Test the subdivision topology cache evicts its oldest mesh when full"""
+        model = AdvancedMathematicalModel()
+        grids = [_quad_grid(n)[1] for n in range(2, _MESH_CACHE_SIZE + 3)]
+
+        S_first, _ = model._subdivision_topology(grids[0], 4)
+        for faces in grids[1:]:
+            model._subdivision_topology(faces, faces.max() + 1)
+        S_again, _ = model._subdivision_topology(grids[0].copy(), 4)
+
+        assert len(model._subdivision_cache) == _MESH_CACHE_SIZE
+        assert S_again is not S_first
+        assert (S_again != S_first).nnz == 0
+
+
+
+def _quad_grid(n=4):
+    """Vertices and quad faces of an n x n vertex grid"""
+    idx = np.arange(n * n).reshape(n, n)
+    faces = np.stack([idx[:-1, :-1], idx[:-1, 1:], idx[1:, 1:], idx[1:, :-1]], axis=-1).reshape(-1, 4)
+    return np.random.randn(n * n, 3), faces
+
+
+class TestGPUSubdivider:
+    def test_matches_catmull_clark(self):
+        """Test the composed subdivision matrix matches repeated subdivision"""
+        model = AdvancedMathematicalModel()
+        vertices, faces = _quad_grid()
+        
+        subdivider = GPUSubdivider(faces, len(vertices), 2)
+        expected_verts, expected_faces = model.catmull_clark_subdivision(vertices, faces, 2)
+        
+        assert np.allclose(subdivider.subdivide(vertices), expected_verts)
+        assert np.array_equal(subdivider.faces, expected_faces)
+    
+    def test_blended_matches_apply_then_subdivide(self):
+        """Test blended subdivision equals blending first, then subdividing"""
+        model = AdvancedMathematicalModel()
+        vertices, faces = _quad_grid()
+        shapes = np.stack(model.create_smpl_blend_shapes(vertices, n_shapes=4))
+        weights = np.array([0.3, -0.2, 0.5, 0.1])
+        
+        subdivider = GPUSubdivider(faces, len(vertices), 1, model=model)
+        blended = model.apply_blend_shapes(vertices, list(shapes), weights)
+        
+        assert np.allclose(subdivider.subdivide_blended(vertices, shapes, weights),
+                           subdivider.subdivide(blended))
+    
+    def test_falls_back_when_device_unusable(self, monkeypatch):
+        """Test a CuPy install without a working CUDA device falls back to SciPy"""
+        def no_device(*args, **kwargs):
+            raise RuntimeError("cudaErrorNoDevice")
+        
+        fake_sparse = types.ModuleType('cupyx.scipy.sparse')
+        fake_sparse.csr_matrix = no_device
+        for name, module in [('cupy', types.ModuleType('cupy')),
+                             ('cupyx', types.ModuleType('cupyx')),
+                             ('cupyx.scipy', types.ModuleType('cupyx.scipy')),
+                             ('cupyx.scipy.sparse', fake_sparse)]:
+            monkeypatch.setitem(sys.modules, name, module)
+        vertices, faces = _quad_grid()
+        
+        subdivider = GPUSubdivider(faces, len(vertices))
+        
+        assert not subdivider.on_gpu
+        assert subdivider.subdivide(vertices).shape == (len(vertices) + 9 + 24, 3)
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, '-v'])
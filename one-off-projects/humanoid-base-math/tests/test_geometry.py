@@ -15,7 +15,11 @@ from geometry import (
     create_ellipse_profile,
     create_tapered_cylinder,
     create_sphere,
-    loft_profile_along_curve
+    loft_profile_along_curve,
+    loft_profile_stack_along_curve,
+    mirror_vertices_x,
+    prepare_smoother,
+    smooth_vertices_laplacian
 )
 
 
@@ -38,6 +42,23 @@ class TestSplines:
         # First and last should be close (closed loop)
         assert np.allclose(curve[0], curve[-1], atol=0.2)
 
+    
+    def test_straight_spine(self):
+        """Test evenly spaced collinear points sample as a straight line"""
+        points = np.column_stack([np.zeros(6), np.linspace(0, 2, 6), np.zeros(6)])
+        curve = generate_spline_curve(points, num_samples=11)
+        
+        assert np.allclose(curve[:, 1], np.linspace(0, 2, 11))
+        assert np.allclose(curve[:, [0, 2]], 0)
+    
+    def test_repeated_fit_returns_independent_arrays(self):
+        """Test cached spline fits hand out writable copies"""
+        points = np.array([[0, 0], [1, 2], [2, 1], [3, 3], [4, 0]])
+        first = generate_spline_curve(points, num_samples=15)
+        first[:] = 0
+        second = generate_spline_curve(points, num_samples=15)
+        
+        assert second[-1, 0] == pytest.approx(4)
 
 class TestProfiles:
     def test_ellipse_profile(self):
@@ -137,6 +158,20 @@ class TestLofting:
         expected_faces = (len(spine) - 1) * len(profile) * 2
         assert len(faces) == expected_faces
     
+    def test_loft_face_indices(self):
+        """Test each quad splits into two triangles wrapping around the ring"""
+        profile = create_ellipse_profile(1.0, 1.0, segments=4)
+        spine = np.array([[0, 0, 0], [0, 1, 0], [0, 2, 0]])
+        
+        verts, faces = loft_profile_along_curve(profile, spine)
+        
+        assert faces.dtype == np.int32
+        assert faces[0].tolist() == [0, 1, 5]
+        assert faces[1].tolist() == [0, 5, 4]
+        # Last quad of the first band wraps back to the ring start
+        assert faces[6].tolist() == [3, 0, 4]
+        assert faces.max() == len(verts) - 1
+    
     def test_loft_with_scaling(self):
         """Test lofting with scale variation"""
         profile = create_ellipse_profile(1.0, 1.0, segments=8)
@@ -154,6 +189,63 @@ class TestLofting:
         
         assert bottom_size > top_size
 
+    
+    def test_loft_profile_stack(self):
+        """Test one profile per spine point gives a single connected sweep"""
+        profiles = np.stack([create_ellipse_profile(w, 0.5, segments=8) for w in (1.0, 2.0, 1.5)])
+        spine = np.array([[0, 0, 0], [0, 1, 0.1], [0, 2, 0]])
+        
+        verts, faces = loft_profile_stack_along_curve(profiles, spine)
+        
+        assert verts.shape == (3 * 8, 3)
+        assert len(faces) == 2 * 8 * 2
+        # Ring i is profile i placed around spine point i
+        assert np.allclose(verts[8:16, [0, 2]], profiles[1] + spine[1, [0, 2]])
+        assert np.allclose(verts[8:16, 1], 1.0)
+
+
+class TestMirror:
+    def test_mirror_side_faces(self):
+        """Test side faces are mirrored with flipped winding, center faces are not"""
+        verts = np.array([[0.0, 0, 0], [1, 0, 0], [1, 1, 0], [2, 0, 0]])
+        faces = np.array([[0, 1, 2], [1, 3, 2]])
+        
+        all_verts, all_faces = mirror_vertices_x(verts, faces)
+        
+        # Three side vertices get mirrored copies at indices 4, 5, 6
+        assert len(all_verts) == 7
+        assert np.allclose(all_verts[4:], verts[1:] * [-1, 1, 1])
+        # Only the face without a center vertex is mirrored
+        assert all_faces.tolist() == [[0, 1, 2], [1, 3, 2], [4, 5, 6]]
+
+
+class TestSmoothing:
+    def test_laplacian_neighbor_average(self):
+        """Test smoothing blends each vertex toward its neighbor mean"""
+        verts, faces = create_sphere(radius=1.0, lat_segments=5, lon_segments=6)
+        # Unreferenced vertex must stay put
+        verts = np.vstack([verts, [[5.0, 5.0, 5.0]]])
+        
+        smoothed = smooth_vertices_laplacian(verts, faces, iterations=1, factor=0.5)
+        
+        # Top pole's neighbors are the whole first ring
+        ring_mean = verts[1:7].mean(axis=0)
+        assert np.allclose(smoothed[0], 0.5 * verts[0] + 0.5 * ring_mean)
+        assert np.allclose(smoothed[-1], verts[-1])
+        assert smoothed.shape == verts.shape
+    
+    def test_smoother_reused_for_same_topology(self):
+        """Test the smoothing operator is cached per face layout"""
+        verts, faces = create_sphere(radius=1.0, lat_segments=5, lon_segments=6)
+        
+        P = prepare_smoother(faces, len(verts), verts.dtype)
+        
+        assert prepare_smoother(faces.copy(), len(verts), verts.dtype) is P
+        assert prepare_smoother(faces[::-1], len(verts), verts.dtype) is not P
+        assert np.allclose(
+            smooth_vertices_laplacian(verts * 2, faces, operator=P),
+            smooth_vertices_laplacian(verts * 2, faces)
+        )
 
 if __name__ == "__main__":
     # Run tests
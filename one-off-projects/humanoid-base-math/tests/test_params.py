@@ -0,0 +1,96 @@
+"""
+Unit tests for humanoid parameters
+"""
+
+import pytest
+import dataclasses
+import sys
+import os
+
+# Add src to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import params
+from params import HumanoidParams, get_preset
+
+
+class TestHumanoidParams:
+    def test_to_dict_round_trip(self):
+        """Test dict export covers every field and rebuilds an equal instance"""
+        params = HumanoidParams(height=1.9, stockiness=1.2, ear_length=0.4)
+        data = params.to_dict()
+        
+        public = {f.name for f in dataclasses.fields(HumanoidParams) if not f.name.startswith('_')}
+        assert set(data) == public
+        assert HumanoidParams.from_dict(data) == params
+    
+    def test_asdict_round_trip(self):
+        """Test dataclasses.asdict output feeds straight back into from_dict"""
+        params = get_preset('goblin')
+        
+        assert HumanoidParams.from_dict(dataclasses.asdict(params)) == params
+        assert dataclasses.asdict(params) == params.to_dict()
+    
+    def test_to_dict_returns_copy(self):
+        """Test mutating an exported dict does not leak into later exports"""
+        params = HumanoidParams()
+        params.to_dict()['height'] = 2.5
+        
+        assert params.to_dict()['height'] == 1.75
+    
+    def test_immutable(self):
+        """Test parameters are frozen; variants come from dataclasses.replace"""
+        params = get_preset('human_male')
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            params.height = 2.0
+        
+        taller = dataclasses.replace(params, height=2.0)
+        assert taller.height == 2.0
+        assert params.height == 1.75
+    
+    def test_slots(self):
+        """Test instances use slots rather than a per-instance __dict__"""
+        params = HumanoidParams()
+        params.to_dict()
+        
+        assert not hasattr(params, '__dict__')
+        assert hash(params) == hash(HumanoidParams())
+    
+    def test_save_load(self, tmp_path):
+        """Test JSON save/load round trip"""
+        params = get_preset('elf')
+        path = tmp_path / 'elf.json'
+        
+        params.save(str(path))
+        
+        assert HumanoidParams.load(str(path)) == params
+    
+    def test_validation(self):
+        """Test out-of-range parameters are rejected"""
+        with pytest.raises(AssertionError):
+            HumanoidParams(height=5.0)
+
+
+
+class TestPresets:
+    def test_preset_built_once(self):
+        """Test repeated lookups share one validated instance"""
+        assert get_preset('dwarf') is get_preset('dwarf')
+        assert get_preset('dwarf').height == 1.2
+    
+    def test_presets_mapping(self):
+        """Test PRESETS still maps every preset name to its params"""
+        presets = params.PRESETS
+        
+        assert set(presets) == set(params.PRESET_SPECS)
+        assert presets['orc'] is get_preset('orc')
+    
+    def test_unknown_preset(self):
+        """Test unknown names raise ValueError"""
+        with pytest.raises(ValueError):
+            get_preset('dragon')
+
+if __name__ == "__main__":
+    # Run tests
+    pytest.main([__file__, '-v'])